@@ -1,937 +1,1601 @@
-"""
-MySQL to PostgreSQL Migration Tool
-Version: 1.0.0
-
-A comprehensive tool for migrating databases from MySQL to PostgreSQL,
-preserving schema structure, data, relationships, and constraints.
-
-Author: Pratush Mishra
-Date: December 27, 2025
-"""
-
-import mysql.connector
-import psycopg2
-import psycopg2.extras
-import psycopg2.sql
-import logging
-import re
-from datetime import datetime
-import getpass
-import sys
-import os
-import time
-from tqdm import tqdm  # For progress bars
-
-# Version information
-__version__ = "1.0.0"
-__author__ = "Pratush Mishra"
-__date__ = "2025-12-27"
-
-# Configure logging
-logging.basicConfig(
-    filename='migration.log', 
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    filemode='a'  # Append mode to preserve previous logs
-)
-
-# Type Mapping from MySQL to PostgreSQL
-# This dictionary maps MySQL data types to their PostgreSQL equivalents
-TYPE_MAPPING = {
-    'int': 'INTEGER',
-    'bigint': 'BIGINT',
-    'smallint': 'SMALLINT',
-    'tinyint': 'SMALLINT',
-    'mediumint': 'INTEGER',
-    'varchar': 'VARCHAR',
-    'char': 'CHAR',
-    'text': 'TEXT',
-    'longtext': 'TEXT',
-    'mediumtext': 'TEXT',
-    'tinytext': 'TEXT',
-    'datetime': 'TIMESTAMP',
-    'timestamp': 'TIMESTAMP',
-    'date': 'DATE',
-    'time': 'TIME',
-    'decimal': 'NUMERIC',
-    'float': 'REAL',
-    'double': 'DOUBLE PRECISION',
-    'bit': 'BOOLEAN',
-    'enum': 'TEXT',
-    'set': 'TEXT',
-    'json': 'JSONB',
-    'blob': 'BYTEA',
-    'longblob': 'BYTEA',
-    'mediumblob': 'BYTEA',
-    'tinyblob': 'BYTEA',
-    'binary': 'BYTEA',
-    'varbinary': 'BYTEA',
-    'year': 'INTEGER'
-}
-
-def retry_operation(max_retries=3, delay=1):
-    """
-    Retry decorator for database operations
-    """
-    def decorator(func):
-        def wrapper(*args, **kwargs):
-            for attempt in range(max_retries):
-                try:
-                    return func(*args, **kwargs)
-                except (mysql.connector.Error, psycopg2.Error) as e:
-                    if attempt == max_retries - 1:
-                        raise e
-                    logging.warning(f"⚠ Attempt {attempt + 1} failed: {e}. Retrying in {delay} seconds...")
-                    time.sleep(delay)
-            return None
-        return wrapper
-    return decorator
-
-def get_credentials():
-    """
-    Get MySQL and PostgreSQL connection credentials
-    Supports environment variables for automation, falls back to interactive prompts
-    """
-    # Check for environment variables first
-    mysql_host = os.getenv('MYSQL_HOST', '')
-    mysql_port = os.getenv('MYSQL_PORT', '')
-    mysql_user = os.getenv('MYSQL_USER', '')
-    mysql_password = os.getenv('MYSQL_PASSWORD', '')
-    mysql_db = os.getenv('MYSQL_DATABASE', '')
-    
-    pg_host = os.getenv('POSTGRES_HOST', '')
-    pg_port = os.getenv('POSTGRES_PORT', '')
-    pg_user = os.getenv('POSTGRES_USER', '')
-    pg_password = os.getenv('POSTGRES_PASSWORD', '')
-    pg_db = os.getenv('POSTGRES_DATABASE', '')
-    
-    # If environment variables are not set, use interactive prompts
-    if not all([mysql_user, mysql_password, mysql_db, pg_user, pg_password, pg_db]):
-        print("=== MySQL Credentials ===")
-        mysql_host = mysql_host or input("MySQL Host (default: localhost): ") or "localhost"
-        mysql_port = mysql_port or input("MySQL Port (default: 3306): ") or "3306"
-        mysql_user = mysql_user or input("MySQL Username: ")
-        mysql_password = mysql_password or getpass.getpass("MySQL Password: ")
-        mysql_db = mysql_db or input("MySQL Database: ")
-        
-        print("\n=== PostgreSQL Credentials ===")
-        pg_host = pg_host or input("PostgreSQL Host (default: localhost): ") or "localhost"
-        pg_port = pg_port or input("PostgreSQL Port (default: 5432): ") or "5432"
-        pg_user = pg_user or input("PostgreSQL Username: ")
-        pg_password = pg_password or getpass.getpass("PostgreSQL Password: ")
-        pg_db = pg_db or input("PostgreSQL Database: ")
-    
-    # Convert ports to integers
-    mysql_port = int(mysql_port) if mysql_port else 3306
-    pg_port = int(pg_port) if pg_port else 5432
-    
-    # Validate required fields
-    if not mysql_user or not mysql_password or not mysql_db:
-        raise ValueError("MySQL username, password, and database are required")
-    if not pg_user or not pg_password or not pg_db:
-        raise ValueError("PostgreSQL username, password, and database are required")
-    
-    # Validate port numbers
-    if not (1 <= mysql_port <= 65535):
-        raise ValueError("MySQL port must be between 1 and 65535")
-    if not (1 <= pg_port <= 65535):
-        raise ValueError("PostgreSQL port must be between 1 and 65535")
-    
-    return {
-        "mysql": {
-            "host": mysql_host,
-            "port": mysql_port,
-            "user": mysql_user,
-            "password": mysql_password,
-            "database": mysql_db
-        },
-        "postgres": {
-            "host": pg_host,
-            "port": pg_port,
-            "user": pg_user,
-            "password": pg_password,
-            "database": pg_db
-        }
-    }
-
-def sanitize_row(row):
-    """
-    Clean and prepare row data for PostgreSQL
-    Handles NULL values, date formats, and binary data
-    """
-    sanitized = {}
-    for key, value in row.items():
-        # Handle None values
-        if value is None:
-            sanitized[key] = None
-        # Handle date/datetime strings
-        elif isinstance(value, str) and re.match(r'^\d{4}-\d{2}-\d{2}', value):
-            try:
-                # Handle invalid dates like 0000-00-00
-                if value.startswith("0000-00-00"):
-                    sanitized[key] = None
-                else:
-                    # Validate the date format
-                    datetime.strptime(value[:10], "%Y-%m-%d")
-                    sanitized[key] = value
-            except ValueError:
-                sanitized[key] = None
-        # Handle binary data
-        elif isinstance(value, bytes):
-            sanitized[key] = value
-        # Default case
-        else:
-            sanitized[key] = value
-    return sanitized
-
-def get_mysql_tables(mysql_cursor, db_name):
-    """
-    Get a list of all tables in the MySQL database
-    """
-    mysql_cursor.execute("SHOW TABLES")
-    tables = mysql_cursor.fetchall()
-    
-    # The column name depends on the database name
-    column_name = f'Tables_in_{db_name}'
-    
-    # Handle case where column name might be different
-    if len(tables) > 0 and column_name not in tables[0]:
-        column_name = list(tables[0].keys())[0]
-        
-    return [row[column_name] for row in tables]
-
-def get_table_schema(mysql_cursor, table_name):
-    """
-    Get the schema definition for a MySQL table
-    Returns column definitions and primary keys with preserved case
-    """
-    mysql_cursor.execute(f"DESCRIBE `{table_name}`")
-    columns = mysql_cursor.fetchall()
-    
-    column_defs = []
-    primary_keys = []
-    column_mapping = {}  # To track original column names to preserve case
-    
-    for column in columns:
-        col_name = column['Field']
-        col_type = column['Type']
-        col_null = column['Null']
-        col_key = column['Key']
-        col_default = column['Default']
-        col_extra = column['Extra']
-        
-        # Store original column name for case preservation
-        column_mapping[col_name.lower()] = col_name
-        
-        # Extract base type (e.g., varchar from varchar(255))
-        base_type = re.match(r'(\w+)', col_type.lower()).group(1)
-        
-        # Map MySQL type to PostgreSQL type
-        pg_type = TYPE_MAPPING.get(base_type, 'TEXT')
-        
-        # Handle size for types like varchar, char, etc.
-        if '(' in col_type and base_type in ['varchar', 'char', 'decimal', 'numeric']:
-            size = re.search(r'\((.*?)\)', col_type).group(1)
-            pg_type += f"({size})"
-        
-        # Handle auto_increment
-        if 'auto_increment' in col_extra:
-            pg_type = "SERIAL" if pg_type == "INTEGER" else "BIGSERIAL" if pg_type == "BIGINT" else pg_type
-        
-        # Build column definition - use lowercase for case-insensitive behavior
-        column_def = f'{col_name.lower()} {pg_type}'
-        
-        # Add NOT NULL constraint if needed
-        if col_null == 'NO':
-            column_def += " NOT NULL"
-        
-        # Add default value if present and not auto_increment
-        if col_default is not None and 'auto_increment' not in col_extra:
-            if col_default == 'CURRENT_TIMESTAMP':
-                column_def += " DEFAULT CURRENT_TIMESTAMP"
-            elif base_type in ['char', 'varchar', 'text', 'enum']:
-                # Escape single quotes in default values to prevent SQL injection
-                escaped_default = col_default.replace("'", "''")
-                column_def += f" DEFAULT '{escaped_default}'"
-            else:
-                # For numeric defaults, validate they're safe
-                try:
-                    float(col_default)  # Test if it's a valid number
-                    column_def += f" DEFAULT {col_default}"
-                except ValueError:
-                    # If not a valid number, treat as string
-                    escaped_default = col_default.replace("'", "''")
-                    column_def += f" DEFAULT '{escaped_default}'"
-        
-        column_defs.append(column_def)
-        
-        # Track primary keys - use lowercase for case-insensitive behavior
-        if col_key == "PRI":
-            primary_keys.append(col_name.lower())
-    
-    return column_defs, primary_keys, column_mapping
-
-def get_foreign_keys(mysql_cursor, table_name, db_name):
-    """
-    Get foreign key relationships for a MySQL table
-    Returns a list of foreign key definitions with preserved case and actions
-    """
-    query = """
-    SELECT
-        kcu.COLUMN_NAME,
-        kcu.REFERENCED_TABLE_NAME,
-        kcu.REFERENCED_COLUMN_NAME,
-        kcu.CONSTRAINT_NAME,
-        rc.UPDATE_RULE,
-        rc.DELETE_RULE
-    FROM
-        INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
-    LEFT JOIN
-        INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS rc
-        ON kcu.CONSTRAINT_NAME = rc.CONSTRAINT_NAME
-        AND kcu.TABLE_SCHEMA = rc.CONSTRAINT_SCHEMA
-    WHERE
-        kcu.TABLE_SCHEMA = %s AND
-        kcu.TABLE_NAME = %s AND
-        kcu.REFERENCED_TABLE_NAME IS NOT NULL
-    """
-    mysql_cursor.execute(query, (db_name, table_name))
-    return mysql_cursor.fetchall()
-
-def get_table_dependencies(mysql_cursor, db_name):
-    """
-    Get table dependency order to ensure proper migration sequence
-    Returns tables ordered by dependency (parent tables first)
-    Handles circular dependencies by breaking them
-    """
-    query = """
-    SELECT DISTINCT
-        t1.TABLE_NAME as child_table,
-        t2.TABLE_NAME as parent_table
-    FROM
-        INFORMATION_SCHEMA.KEY_COLUMN_USAGE t1
-    JOIN
-        INFORMATION_SCHEMA.KEY_COLUMN_USAGE t2
-        ON t1.REFERENCED_TABLE_NAME = t2.TABLE_NAME
-        AND t1.REFERENCED_COLUMN_NAME = t2.COLUMN_NAME
-    WHERE
-        t1.TABLE_SCHEMA = %s AND
-        t2.TABLE_SCHEMA = %s AND
-        t1.REFERENCED_TABLE_NAME IS NOT NULL
-    """
-    mysql_cursor.execute(query, (db_name, db_name))
-    dependencies = mysql_cursor.fetchall()
-    
-    # Build dependency graph
-    graph = {}
-    in_degree = {}
-    
-    # Get all tables first
-    all_tables = get_mysql_tables(mysql_cursor, db_name)
-    for table in all_tables:
-        graph[table] = []
-        in_degree[table] = 0
-    
-    # Add dependencies
-    for dep in dependencies:
-        child = dep['child_table']
-        parent = dep['parent_table']
-        if parent in graph and child != parent:  # Avoid self-references
-            graph[parent].append(child)
-            in_degree[child] += 1
-    
-    # Topological sort with cycle detection
-    queue = [table for table in all_tables if in_degree[table] == 0]
-    ordered_tables = []
-    processed_count = 0
-    
-    while queue:
-        current = queue.pop(0)
-        ordered_tables.append(current)
-        processed_count += 1
-        
-        for child in graph[current]:
-            in_degree[child] -= 1
-            if in_degree[child] == 0:
-                queue.append(child)
-    
-    # Handle circular dependencies
-    if processed_count < len(all_tables):
-        remaining_tables = [table for table in all_tables if table not in ordered_tables]
-        logging.warning(f"⚠ Circular dependencies detected. Adding remaining tables: {remaining_tables}")
-        ordered_tables.extend(remaining_tables)
-    
-    return ordered_tables
-
-def create_pg_table(pg_cursor, table_name, schema, pkeys):
-    """
-    Create a PostgreSQL table with the given schema
-    Uses lowercase table names for case-insensitive behavior
-    Uses proper SQL identifier escaping for security
-    """
-    # Use lowercase table name for case-insensitive behavior
-    # Use proper SQL identifier escaping
-    drop_query = psycopg2.sql.SQL("DROP TABLE IF EXISTS {} CASCADE").format(
-        psycopg2.sql.Identifier(table_name.lower())
-    )
-    pg_cursor.execute(drop_query)
-    
-    # Build CREATE TABLE query with proper escaping
-    schema_sql = psycopg2.sql.SQL(", ").join([
-        psycopg2.sql.SQL(col_def) for col_def in schema
-    ])
-    
-    if pkeys:
-        pkeys_sql = psycopg2.sql.SQL(", ").join([
-            psycopg2.sql.Identifier(pk) for pk in pkeys
-        ])
-        create_query = psycopg2.sql.SQL("CREATE TABLE {} ({}, PRIMARY KEY ({}))").format(
-            psycopg2.sql.Identifier(table_name.lower()),
-            schema_sql,
-            pkeys_sql
-        )
-    else:
-        create_query = psycopg2.sql.SQL("CREATE TABLE {} ({})").format(
-            psycopg2.sql.Identifier(table_name.lower()),
-            schema_sql
-        )
-    
-    pg_cursor.execute(create_query)
-    logging.info(f"✅ Created PostgreSQL table: {table_name.lower()}")
-
-def add_foreign_keys(pg_cursor, table_name, foreign_keys):
-    """
-    Add foreign key constraints to a PostgreSQL table
-    Uses lowercase identifiers for case-insensitive behavior
-    Uses proper SQL identifier escaping for security
-    """
-    for fk in foreign_keys:
-        column_name = fk['COLUMN_NAME'].lower()
-        ref_table = fk['REFERENCED_TABLE_NAME'].lower()
-        ref_column = fk['REFERENCED_COLUMN_NAME'].lower()
-        update_rule = fk.get('UPDATE_RULE', 'RESTRICT')
-        delete_rule = fk.get('DELETE_RULE', 'RESTRICT')
-        
-        constraint_name = f"fk_{table_name.lower()}_{column_name}"
-        
-        # Map MySQL actions to PostgreSQL actions
-        action_mapping = {
-            'RESTRICT': 'RESTRICT',
-            'CASCADE': 'CASCADE',
-            'SET NULL': 'SET NULL',
-            'NO ACTION': 'NO ACTION',
-            'SET DEFAULT': 'SET DEFAULT'
-        }
-        
-        pg_update_action = action_mapping.get(update_rule, 'RESTRICT')
-        pg_delete_action = action_mapping.get(delete_rule, 'RESTRICT')
-        
-        # Use proper SQL identifier escaping
-        try:
-            query = psycopg2.sql.SQL("""
-                ALTER TABLE {} 
-                ADD CONSTRAINT {} 
-                FOREIGN KEY ({}) 
-                REFERENCES {} ({})
-                ON UPDATE {} 
-                ON DELETE {}
-                DEFERRABLE INITIALLY DEFERRED
-            """).format(
-                psycopg2.sql.Identifier(table_name.lower()),
-                psycopg2.sql.Identifier(constraint_name),
-                psycopg2.sql.Identifier(column_name),
-                psycopg2.sql.Identifier(ref_table),
-                psycopg2.sql.Identifier(ref_column),
-                psycopg2.sql.SQL(pg_update_action),
-                psycopg2.sql.SQL(pg_delete_action)
-            )
-            pg_cursor.execute(query)
-            logging.info(f"✅ Added foreign key: {constraint_name} (UPDATE: {pg_update_action}, DELETE: {pg_delete_action})")
-        except Exception as e:
-            logging.warning(f"⚠ Could not add foreign key {constraint_name}: {e}")
-
-def get_indexes_and_constraints(mysql_cursor, table_name, db_name):
-    """
-    Get indexes and unique constraints from MySQL table
-    """
-    # Get indexes
-    index_query = """
-    SELECT DISTINCT
-        INDEX_NAME,
-        COLUMN_NAME,
-        NON_UNIQUE,
-        INDEX_TYPE
-    FROM
-        INFORMATION_SCHEMA.STATISTICS
-    WHERE
-        TABLE_SCHEMA = %s AND
-        TABLE_NAME = %s AND
-        INDEX_NAME != 'PRIMARY'
-    ORDER BY INDEX_NAME, SEQ_IN_INDEX
-    """
-    mysql_cursor.execute(index_query, (db_name, table_name))
-    indexes = mysql_cursor.fetchall()
-    
-    # Group by index name
-    index_groups = {}
-    for idx in indexes:
-        idx_name = idx['INDEX_NAME']
-        if idx_name not in index_groups:
-            index_groups[idx_name] = {
-                'columns': [],
-                'unique': idx['NON_UNIQUE'] == 0,
-                'type': idx['INDEX_TYPE']
-            }
-        index_groups[idx_name]['columns'].append(idx['COLUMN_NAME'])
-    
-    return index_groups
-
-def create_indexes_and_constraints(pg_cursor, table_name, indexes):
-    """
-    Create indexes and unique constraints in PostgreSQL
-    Uses lowercase identifiers for case-insensitive behavior
-    Uses proper SQL identifier escaping for security
-    """
-    for idx_name, idx_info in indexes.items():
-        columns = [col.lower() for col in idx_info['columns']]
-        
-        if idx_info['unique']:
-            # Create unique constraint
-            constraint_name = f"uk_{table_name.lower()}_{idx_name.lower()}"
-            try:
-                column_identifiers = [psycopg2.sql.Identifier(col) for col in columns]
-                query = psycopg2.sql.SQL("ALTER TABLE {} ADD CONSTRAINT {} UNIQUE ({})").format(
-                    psycopg2.sql.Identifier(table_name.lower()),
-                    psycopg2.sql.Identifier(constraint_name),
-                    psycopg2.sql.SQL(", ").join(column_identifiers)
-                )
-                pg_cursor.execute(query)
-                logging.info(f"✅ Added unique constraint: {constraint_name}")
-            except Exception as e:
-                logging.warning(f"⚠ Could not add unique constraint {constraint_name}: {e}")
-        else:
-            # Create regular index
-            index_name = f"idx_{table_name.lower()}_{idx_name.lower()}"
-            try:
-                column_identifiers = [psycopg2.sql.Identifier(col) for col in columns]
-                query = psycopg2.sql.SQL("CREATE INDEX {} ON {} ({})").format(
-                    psycopg2.sql.Identifier(index_name),
-                    psycopg2.sql.Identifier(table_name.lower()),
-                    psycopg2.sql.SQL(", ").join(column_identifiers)
-                )
-                pg_cursor.execute(query)
-                logging.info(f"✅ Created index: {index_name}")
-            except Exception as e:
-                logging.warning(f"⚠ Could not create index {index_name}: {e}")
-
-def update_sequences(pg_cursor, table_name, mysql_cursor):
-    """
-    Update PostgreSQL sequences to continue from the highest migrated value
-    This fixes the auto-increment reset issue
-    Uses proper SQL identifier escaping for security
-    """
-    # Get all auto-increment columns from MySQL
-    mysql_cursor.execute(f"DESCRIBE `{table_name}`")
-    columns = mysql_cursor.fetchall()
-    
-    for column in columns:
-        if 'auto_increment' in column['Extra']:
-            col_name = column['Field']
-            
-            # Get the maximum value from the migrated data
-            # Use proper SQL identifier escaping
-            max_query = psycopg2.sql.SQL("SELECT MAX({}) FROM {}").format(
-                psycopg2.sql.Identifier(col_name.lower()),
-                psycopg2.sql.Identifier(table_name.lower())
-            )
-            pg_cursor.execute(max_query)
-            max_val = pg_cursor.fetchone()[0]
-            
-            if max_val is not None:
-                # PostgreSQL sequence naming convention: tablename_columnname_seq
-                # Try multiple sequence naming conventions
-                sequence_names = [
-                    f"{table_name.lower()}_{col_name.lower()}_seq",
-                    f"{table_name}_{col_name}_seq",
-                    f"{table_name.lower()}_{col_name}_seq",
-                    f"{table_name}_{col_name.lower()}_seq"
-                ]
-                
-                sequence_updated = False
-                for seq_name in sequence_names:
-                    try:
-                        # Use proper SQL identifier escaping
-                        setval_query = psycopg2.sql.SQL("SELECT setval({}, %s, true)").format(
-                            psycopg2.sql.Literal(seq_name)
-                        )
-                        pg_cursor.execute(setval_query, (max_val,))
-                        logging.info(f"✅ Updated sequence {seq_name} to start from {max_val + 1}")
-                        sequence_updated = True
-                        break
-                    except Exception as e:
-                        continue
-                
-                if not sequence_updated:
-                    logging.warning(f"⚠ Could not update sequence for {table_name}.{col_name}. Tried: {', '.join(sequence_names)}")
-                    # Try to find the actual sequence name from PostgreSQL
-                    try:
-                        find_seq_query = psycopg2.sql.SQL("""
-                            SELECT sequence_name 
-                            FROM information_schema.sequences 
-                            WHERE sequence_schema = 'public' 
-                            AND sequence_name LIKE {}
-                        """).format(psycopg2.sql.Literal(f"%{table_name.lower()}%{col_name.lower()}%"))
-                        pg_cursor.execute(find_seq_query)
-                        result = pg_cursor.fetchone()
-                        if result:
-                            actual_seq_name = result[0]
-                            setval_query = psycopg2.sql.SQL("SELECT setval({}, %s, true)").format(
-                                psycopg2.sql.Literal(actual_seq_name)
-                            )
-                            pg_cursor.execute(setval_query, (max_val,))
-                            logging.info(f"✅ Updated sequence {actual_seq_name} to start from {max_val + 1}")
-                    except Exception as e2:
-                        logging.error(f"❌ Failed to update sequence for {table_name}.{col_name}: {e2}")
-
-def validate_foreign_keys(mysql_cursor, pg_cursor, table_name, db_name):
-    """
-    Validate that foreign key relationships are properly maintained
-    Uses proper SQL identifier escaping for security
-    """
-    foreign_keys = get_foreign_keys(mysql_cursor, table_name, db_name)
-    
-    for fk in foreign_keys:
-        column_name = fk['COLUMN_NAME']
-        ref_table = fk['REFERENCED_TABLE_NAME']
-        ref_column = fk['REFERENCED_COLUMN_NAME']
-        
-        # Check for orphaned records using proper SQL escaping
-        query = psycopg2.sql.SQL("""
-            SELECT COUNT(*) FROM {} t1
-            WHERE t1.{} IS NOT NULL
-            AND NOT EXISTS (
-                SELECT 1 FROM {} t2
-                WHERE t2.{} = t1.{}
-            )
-        """).format(
-            psycopg2.sql.Identifier(table_name.lower()),
-            psycopg2.sql.Identifier(column_name.lower()),
-            psycopg2.sql.Identifier(ref_table.lower()),
-            psycopg2.sql.Identifier(ref_column.lower()),
-            psycopg2.sql.Identifier(column_name.lower())
-        )
-        
-        pg_cursor.execute(query)
-        orphaned_count = pg_cursor.fetchone()[0]
-        
-        if orphaned_count > 0:
-            logging.warning(f"⚠ Found {orphaned_count} orphaned records in {table_name}.{column_name}")
-            return False
-        else:
-            logging.info(f"✅ Foreign key validation passed for {table_name}.{column_name}")
-    
-    return True
-
-def validate_data_integrity(mysql_cursor, pg_cursor, table_name):
-    """
-    Validate that data migration was successful by comparing row counts
-    Uses proper SQL identifier escaping for security
-    """
-    # Get MySQL row count
-    mysql_cursor.execute(f"SELECT COUNT(*) as count FROM `{table_name}`")
-    mysql_count = mysql_cursor.fetchone()['count']
-    
-    # Get PostgreSQL row count using proper SQL escaping
-    query = psycopg2.sql.SQL("SELECT COUNT(*) FROM {}").format(
-        psycopg2.sql.Identifier(table_name.lower())
-    )
-    pg_cursor.execute(query)
-    pg_count = pg_cursor.fetchone()[0]
-    
-    if mysql_count != pg_count:
-        logging.error(f"❌ Row count mismatch in {table_name}: MySQL={mysql_count}, PostgreSQL={pg_count}")
-        return False
-    else:
-        logging.info(f"✅ Row count validated for {table_name}: {pg_count} rows")
-        return True
-
-def migrate_table_data(mysql_cursor, pg_cursor, pg_conn, table_name, column_mapping=None):
-    """
-    Migrate data from MySQL table to PostgreSQL table
-    Preserves case by quoting all identifiers
-    Uses column_mapping to ensure case consistency
-    """
-    # Get row count for progress bar
-    mysql_cursor.execute(f"SELECT COUNT(*) as count FROM `{table_name}`")
-    row_count = mysql_cursor.fetchone()['count']
-    
-    if row_count == 0:
-        logging.info(f"⚠ No data in table: {table_name}")
-        return
-    
-    # Get data in batches
-    batch_size = 1000
-    total_inserted = 0
-    
-    # Create progress bar
-    progress = tqdm(total=row_count, desc=f"Migrating {table_name}")
-    
-    for offset in range(0, row_count, batch_size):
-        mysql_cursor.execute(f"SELECT * FROM `{table_name}` LIMIT {batch_size} OFFSET {offset}")
-        rows = mysql_cursor.fetchall()
-        
-        if not rows:
-            break
-            
-        # Get column names from the first row
-        original_col_names = list(rows[0].keys())
-        
-        # Use lowercase column names for case-insensitive behavior
-        lowercase_cols = [col.lower() for col in original_col_names]
-        
-        # Use proper SQL identifier escaping for table and column names
-        # Table and column names come from database schema, so we use Identifier for safety
-        table_identifier = psycopg2.sql.Identifier(table_name.lower())
-        column_identifiers = [psycopg2.sql.Identifier(col) for col in lowercase_cols]
-        
-        # Build INSERT query with proper escaping for identifiers
-        # Use %s placeholders for values (execute_batch requires string format with %s)
-        placeholders_str = ', '.join(['%s'] * len(original_col_names))
-        insert_query = psycopg2.sql.SQL("INSERT INTO {} ({}) VALUES ({})").format(
-            table_identifier,
-            psycopg2.sql.SQL(", ").join(column_identifiers),
-            psycopg2.sql.SQL(placeholders_str)
-        )
-        # Convert to string for execute_batch
-        insert_query_str = insert_query.as_string(pg_cursor)
-        
-        sanitized_batch = []
-        for row in rows:
-            try:
-                sanitized = sanitize_row(row)
-                sanitized_batch.append(tuple(sanitized[col] for col in original_col_names))
-            except Exception as e:
-                logging.warning(f"Skipping row in {table_name} due to sanitization error: {e}")
-        
-        try:
-            psycopg2.extras.execute_batch(pg_cursor, insert_query_str, sanitized_batch)
-            pg_conn.commit()
-            total_inserted += len(sanitized_batch)
-            progress.update(len(sanitized_batch))
-        except Exception as batch_err:
-            logging.error(f"❌ Batch insert error in {table_name}: {batch_err}")
-            pg_conn.rollback()
-            
-            # Try inserting row by row
-            for val in sanitized_batch:
-                try:
-                    pg_cursor.execute(insert_query_str, val)
-                    pg_conn.commit()
-                    total_inserted += 1
-                    progress.update(1)
-                except Exception as row_err:
-                    pg_conn.rollback()
-                    logging.warning(f"⚠ Failed row insert in {table_name}: {row_err}")
-    
-    progress.close()
-    logging.info(f"✅ Migrated {total_inserted} of {row_count} records from {table_name}")
-
-def generate_migration_report(mysql_cursor, pg_cursor, tables, db_name):
-    """
-    Generate a comprehensive migration report
-    """
-    report = []
-    report.append("=" * 60)
-    report.append("MIGRATION REPORT")
-    report.append("=" * 60)
-    
-    total_mysql_rows = 0
-    total_pg_rows = 0
-    
-    for table in tables:
-        # Get row counts
-        mysql_cursor.execute(f"SELECT COUNT(*) as count FROM `{table}`")
-        mysql_count = mysql_cursor.fetchone()['count']
-        
-        # Use proper SQL identifier escaping
-        count_query = psycopg2.sql.SQL("SELECT COUNT(*) FROM {}").format(
-            psycopg2.sql.Identifier(table.lower())
-        )
-        pg_cursor.execute(count_query)
-        pg_count = pg_cursor.fetchone()[0]
-        
-        total_mysql_rows += mysql_count
-        total_pg_rows += pg_count
-        
-        status = "✅ SUCCESS" if mysql_count == pg_count else "❌ MISMATCH"
-        report.append(f"Table: {table:<30} MySQL: {mysql_count:>8} PostgreSQL: {pg_count:>8} {status}")
-        
-        # Check for auto-increment columns
-        mysql_cursor.execute(f"DESCRIBE `{table}`")
-        columns = mysql_cursor.fetchall()
-        auto_increment_cols = [col['Field'] for col in columns if 'auto_increment' in col['Extra']]
-        
-        if auto_increment_cols:
-            report.append(f"  Auto-increment columns: {', '.join(auto_increment_cols)}")
-    
-    report.append("-" * 60)
-    report.append(f"TOTAL RECORDS: MySQL: {total_mysql_rows:>8} PostgreSQL: {total_pg_rows:>8}")
-    report.append("=" * 60)
-    
-    return "\n".join(report)
-
-def migrate_all(credentials):
-    """
-    Main migration function that orchestrates the entire process
-    Handles case sensitivity throughout the migration
-    Fixes foreign key dependency issues and auto-increment sequences
-    """
-    mysql_conn = None
-    mysql_cursor = None
-    pg_conn = None
-    pg_cursor = None
-    
-    try:
-        # Connect to MySQL
-        logging.info("🔌 Connecting to MySQL...")
-        mysql_conn = mysql.connector.connect(**credentials["mysql"])
-        mysql_cursor = mysql_conn.cursor(dictionary=True)
-        logging.info("✅ MySQL connection established")
-        
-        # Connect to PostgreSQL
-        logging.info("🔌 Connecting to PostgreSQL...")
-        pg_conn = psycopg2.connect(**credentials["postgres"])
-        pg_cursor = pg_conn.cursor()
-        logging.info("✅ PostgreSQL connection established")
-        
-        # Start transaction
-        pg_conn.autocommit = False
-        
-        # Get all tables ordered by dependency (parent tables first)
-        tables = get_table_dependencies(mysql_cursor, credentials["mysql"]["database"])
-        
-        if not tables:
-            logging.warning("No tables found in MySQL.")
-            return
-        
-        logging.info(f"📋 Migration order: {', '.join(tables)}")
-        
-        # Store column mappings for each table to preserve case
-        column_mappings = {}
-        
-        # First pass: Create all tables without foreign keys
-        logging.info("🏗️ Creating table structures...")
-        for table in tables:
-            logging.info(f"--- Creating Table: {table} ---")
-            schema, pkeys, col_mapping = get_table_schema(mysql_cursor, table)
-            create_pg_table(pg_cursor, table, schema, pkeys)
-            column_mappings[table] = col_mapping
-        
-        # Second pass: Migrate data in dependency order
-        logging.info("📦 Migrating data...")
-        for table in tables:
-            logging.info(f"--- Migrating Data for Table: {table} ---")
-            migrate_table_data(mysql_cursor, pg_cursor, pg_conn, table, column_mappings[table])
-            
-            # Validate data integrity after each table
-            if not validate_data_integrity(mysql_cursor, pg_cursor, table):
-                logging.error(f"❌ Data validation failed for table: {table}")
-                raise Exception(f"Data validation failed for table: {table}")
-        
-        # Third pass: Update auto-increment sequences
-        logging.info("🔄 Updating auto-increment sequences...")
-        for table in tables:
-            logging.info(f"--- Updating Sequences for Table: {table} ---")
-            update_sequences(pg_cursor, table, mysql_cursor)
-        
-        # Fourth pass: Add indexes and unique constraints
-        logging.info("📇 Creating indexes and unique constraints...")
-        for table in tables:
-            logging.info(f"--- Creating Indexes for Table: {table} ---")
-            indexes = get_indexes_and_constraints(mysql_cursor, table, credentials["mysql"]["database"])
-            if indexes:
-                create_indexes_and_constraints(pg_cursor, table, indexes)
-        
-        # Fifth pass: Add foreign keys in reverse dependency order
-        logging.info("🔗 Adding foreign key constraints...")
-        for table in reversed(tables):  # Reverse order to add child constraints last
-            logging.info(f"--- Adding Foreign Keys for Table: {table} ---")
-            foreign_keys = get_foreign_keys(mysql_cursor, table, credentials["mysql"]["database"])
-            if foreign_keys:
-                add_foreign_keys(pg_cursor, table, foreign_keys)
-        
-        # Sixth pass: Validate foreign key relationships
-        logging.info("🔍 Validating foreign key relationships...")
-        for table in tables:
-            logging.info(f"--- Validating Foreign Keys for Table: {table} ---")
-            if not validate_foreign_keys(mysql_cursor, pg_cursor, table, credentials["mysql"]["database"]):
-                logging.warning(f"⚠ Foreign key validation issues found in table: {table}")
-        
-        # Generate migration report
-        logging.info("📊 Generating migration report...")
-        report = generate_migration_report(mysql_cursor, pg_cursor, tables, credentials["mysql"]["database"])
-        logging.info(f"\n{report}")
-        
-        # Commit transaction
-        pg_conn.commit()
-        logging.info("🎯 All tables migrated successfully!")
-        print("Migration completed successfully! Check migration.log for details.")
-        print(f"\n{report}")
-        
-    except mysql.connector.Error as mysql_err:
-        logging.error(f"❌ MySQL connection error: {mysql_err}")
-        print(f"Error connecting to MySQL: {mysql_err}")
-        if pg_conn:
-            pg_conn.rollback()
-        return
-    except psycopg2.Error as pg_err:
-        logging.error(f"❌ PostgreSQL connection error: {pg_err}")
-        print(f"Error connecting to PostgreSQL: {pg_err}")
-        if pg_conn:
-            pg_conn.rollback()
-        return
-    except Exception as e:
-        logging.error(f"❌ Migration failed: {e}")
-        print(f"Migration failed: {e}")
-        if pg_conn:
-            pg_conn.rollback()
-        return
-
-    finally:
-        # Close connections
-        try:
-            if mysql_cursor:
-                mysql_cursor.close()
-            if mysql_conn:
-                mysql_conn.close()
-            if pg_cursor:
-                pg_cursor.close()
-            if pg_conn:
-                pg_conn.close()
-        except Exception as e:
-            logging.warning(f"⚠ Error closing connections: {e}")
-
-if __name__ == "__main__":
-    print("MySQL to PostgreSQL Migration Tool")
-    print("=" * 40)
-    print(f"Version: {__version__}")
-    print("=" * 40)
-    print()
-    
-    try:
-        creds = get_credentials()
-        print("\nStarting migration process...")
-        print("=" * 40)
-        migrate_all(creds)
-    except ValueError as ve:
-        print(f"\n❌ Input validation error: {ve}")
-        logging.error(f"Input validation error: {ve}")
-        sys.exit(1)
-    except KeyboardInterrupt:
-        print("\n\n❌ Migration aborted by user.")
-        logging.warning("Migration aborted by user")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
-        logging.error(f"Unexpected error: {e}", exc_info=True)
+"""
+MySQL to PostgreSQL Migration Tool
+Version: 1.0.0
+
+A comprehensive tool for migrating databases from MySQL to PostgreSQL,
+preserving schema structure, data, relationships, and constraints.
+
+Author: Pratush Mishra
+Date: December 27, 2025
+"""
+
+import mysql.connector
+import mysql.connector.pooling
+import psycopg2
+import psycopg2.extras
+import psycopg2.pool
+import psycopg2.sql
+import logging
+import re
+import io
+import getpass
+import sys
+import os
+import time
+import concurrent.futures
+import graphlib
+from tqdm import tqdm  # For progress bars
+
+# Version information
+__version__ = "1.0.0"
+__author__ = "Pratush Mishra"
+__date__ = "2025-12-27"
+
+# Maximum number of tables migrated concurrently within a dependency level
+MAX_PARALLEL_TABLES = min(8, os.cpu_count() or 4)
+
+# Precompiled pattern for date-like strings (compiling per cell is costly on large tables)
+DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+# MySQL base types whose values need date sanitization
+DATE_COLUMN_TYPES = frozenset(['date', 'datetime', 'timestamp'])
+
+# Escapes for COPY text format, applied with str.translate
+# Unlike CSV - where an unquoted cell equal to the NULL token is read
+# back as SQL NULL - text format keeps NULL (\N) and the literal
+# two-character string distinguishable, and escaping is a single
+# translate call per cell instead of csv.writer's quoting state machine
+COPY_TEXT_ESCAPE = str.maketrans({
+    '\\': '\\\\',
+    '\t': '\\t',
+    '\n': '\\n',
+    '\r': '\\r'
+})
+
+# Rows accumulated in the COPY buffer before each flush
+# Larger windows amortize COPY start-up; the buffer is the only thing
+# whose size grows with this value
+COPY_FLUSH_ROWS = 10000
+
+# Configure logging
+logging.basicConfig(
+    filename='migration.log', 
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    filemode='a'  # Append mode to preserve previous logs
+)
+
+# Type Mapping from MySQL to PostgreSQL
+# This dictionary maps MySQL data types to their PostgreSQL equivalents
+TYPE_MAPPING = {
+    'int': 'INTEGER',
+    'bigint': 'BIGINT',
+    'smallint': 'SMALLINT',
+    'tinyint': 'SMALLINT',
+    'mediumint': 'INTEGER',
+    'varchar': 'VARCHAR',
+    'char': 'CHAR',
+    'text': 'TEXT',
+    'longtext': 'TEXT',
+    'mediumtext': 'TEXT',
+    'tinytext': 'TEXT',
+    'datetime': 'TIMESTAMP',
+    'timestamp': 'TIMESTAMP',
+    'date': 'DATE',
+    'time': 'TIME',
+    'decimal': 'NUMERIC',
+    'float': 'REAL',
+    'double': 'DOUBLE PRECISION',
+    'bit': 'BOOLEAN',
+    'enum': 'TEXT',
+    'set': 'TEXT',
+    'json': 'JSONB',
+    'blob': 'BYTEA',
+    'longblob': 'BYTEA',
+    'mediumblob': 'BYTEA',
+    'tinyblob': 'BYTEA',
+    'binary': 'BYTEA',
+    'varbinary': 'BYTEA',
+    'year': 'INTEGER'
+}
+
+# Serial type promotion for auto_increment columns
+AUTO_INCREMENT_PROMOTION = {
+    'INTEGER': 'SERIAL',
+    'BIGINT': 'BIGSERIAL',
+    'SMALLINT': 'SMALLSERIAL'
+}
+
+# Map MySQL referential actions to PostgreSQL actions
+FK_ACTION_MAPPING = {
+    'RESTRICT': 'RESTRICT',
+    'CASCADE': 'CASCADE',
+    'SET NULL': 'SET NULL',
+    'NO ACTION': 'NO ACTION',
+    'SET DEFAULT': 'SET DEFAULT'
+}
+
+def retry_operation(max_retries=3, delay=1):
+    """
+    Retry decorator for database operations
+    """
+    def decorator(func):
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_retries):
+                try:
+                    return func(*args, **kwargs)
+                except (mysql.connector.Error, psycopg2.Error) as e:
+                    if attempt == max_retries - 1:
+                        raise e
+                    logging.warning(f"⚠ Attempt {attempt + 1} failed: {e}. Retrying in {delay} seconds...")
+                    time.sleep(delay)
+            return None
+        return wrapper
+    return decorator
+
+def get_credentials():
+    """
+    Get MySQL and PostgreSQL connection credentials
+    Supports environment variables for automation, falls back to interactive prompts
+    """
+    # Check for environment variables first
+    mysql_host = os.getenv('MYSQL_HOST', '')
+    mysql_port = os.getenv('MYSQL_PORT', '')
+    mysql_user = os.getenv('MYSQL_USER', '')
+    mysql_password = os.getenv('MYSQL_PASSWORD', '')
+    mysql_db = os.getenv('MYSQL_DATABASE', '')
+    
+    pg_host = os.getenv('POSTGRES_HOST', '')
+    pg_port = os.getenv('POSTGRES_PORT', '')
+    pg_user = os.getenv('POSTGRES_USER', '')
+    pg_password = os.getenv('POSTGRES_PASSWORD', '')
+    pg_db = os.getenv('POSTGRES_DATABASE', '')
+    
+    # If environment variables are not set, use interactive prompts
+    if not all([mysql_user, mysql_password, mysql_db, pg_user, pg_password, pg_db]):
+        print("=== MySQL Credentials ===")
+        mysql_host = mysql_host or input("MySQL Host (default: localhost): ") or "localhost"
+        mysql_port = mysql_port or input("MySQL Port (default: 3306): ") or "3306"
+        mysql_user = mysql_user or input("MySQL Username: ")
+        mysql_password = mysql_password or getpass.getpass("MySQL Password: ")
+        mysql_db = mysql_db or input("MySQL Database: ")
+        
+        print("\n=== PostgreSQL Credentials ===")
+        pg_host = pg_host or input("PostgreSQL Host (default: localhost): ") or "localhost"
+        pg_port = pg_port or input("PostgreSQL Port (default: 5432): ") or "5432"
+        pg_user = pg_user or input("PostgreSQL Username: ")
+        pg_password = pg_password or getpass.getpass("PostgreSQL Password: ")
+        pg_db = pg_db or input("PostgreSQL Database: ")
+    
+    # Convert ports to integers
+    mysql_port = int(mysql_port) if mysql_port else 3306
+    pg_port = int(pg_port) if pg_port else 5432
+    
+    # Validate required fields
+    if not mysql_user or not mysql_password or not mysql_db:
+        raise ValueError("MySQL username, password, and database are required")
+    if not pg_user or not pg_password or not pg_db:
+        raise ValueError("PostgreSQL username, password, and database are required")
+    
+    # Validate port numbers
+    if not (1 <= mysql_port <= 65535):
+        raise ValueError("MySQL port must be between 1 and 65535")
+    if not (1 <= pg_port <= 65535):
+        raise ValueError("PostgreSQL port must be between 1 and 65535")
+    
+    return {
+        "mysql": {
+            "host": mysql_host,
+            "port": mysql_port,
+            "user": mysql_user,
+            "password": mysql_password,
+            "database": mysql_db
+        },
+        "postgres": {
+            "host": pg_host,
+            "port": pg_port,
+            "user": pg_user,
+            "password": pg_password,
+            "database": pg_db
+        }
+    }
+
+def sanitize_row(row, date_cols=None):
+    """
+    Clean and prepare row data for PostgreSQL
+    Handles NULL values, date formats, and binary data
+    date_cols restricts date validation to the columns that need it;
+    when None, every string cell is checked (slower, but safe)
+    """
+    sanitized = {}
+    for key, value in row.items():
+        # Handle None values
+        if value is None:
+            sanitized[key] = None
+        # Handle date/datetime strings
+        elif (date_cols is None or key in date_cols) and \
+                isinstance(value, str) and DATE_PATTERN.match(value):
+            # Handle invalid dates like 0000-00-00
+            sanitized[key] = value if is_valid_date_string(value) else None
+        # Handle binary data
+        elif isinstance(value, bytes):
+            sanitized[key] = value
+        # Default case
+        else:
+            sanitized[key] = value
+    return sanitized
+
+def is_valid_date_string(value):
+    """
+    Cheap YYYY-MM-DD validation via integer range checks
+    An order of magnitude faster than datetime.strptime, which is all
+    the precision needed to reject zero and malformed MySQL dates
+    """
+    try:
+        year = int(value[:4])
+        month = int(value[5:7])
+        day = int(value[8:10])
+    except ValueError:
+        return False
+    return (value[4] == '-' and value[7] == '-'
+            and year != 0 and 1 <= month <= 12 and 1 <= day <= 31)
+
+def sanitize_date_value(value):
+    """
+    Validate a date-like value, mapping MySQL zero dates and
+    malformed dates to None
+    """
+    if isinstance(value, str) and DATE_PATTERN.match(value):
+        # Handles invalid dates like 0000-00-00
+        if not is_valid_date_string(value):
+            return None
+    return value
+
+def sanitize_identity_value(value):
+    """
+    Pass a value through unchanged (non-date columns need no sanitization)
+    """
+    return value
+
+def build_column_transforms(columns):
+    """
+    Build a list of per-column transform callables aligned to DESCRIBE order
+    Compiling the type dispatch once per table avoids an isinstance chain
+    for every cell of every row
+    """
+    transforms = []
+    for column in columns:
+        base_type = re.match(r'(\w+)', column['Type'].lower()).group(1)
+        if base_type in DATE_COLUMN_TYPES:
+            transforms.append(sanitize_date_value)
+        else:
+            transforms.append(sanitize_identity_value)
+    return transforms
+
+def get_mysql_tables(mysql_cursor, db_name):
+    """
+    Get a list of all tables in the MySQL database
+    Expects a plain tuple cursor; SHOW TABLES returns one column
+    """
+    mysql_cursor.execute("SHOW TABLES")
+    return [row[0] for row in mysql_cursor.fetchall()]
+
+class SchemaCache:
+    """
+    Preloaded MySQL schema metadata for the whole database
+    One information_schema query per category replaces the per-table
+    DESCRIBE/KEY_COLUMN_USAGE/STATISTICS lookups, collapsing O(tables)
+    round-trips into O(1) per category
+    """
+
+    def __init__(self, mysql_meta_cursor, db_name):
+        # A plain tuple cursor keeps the bulk metadata loads cheap - a
+        # dictionary cursor allocates a dict per row, which compounds
+        # across every column, key and index in the database
+        self.db_name = db_name
+        self.tables = get_mysql_tables(mysql_meta_cursor, db_name)
+        self.columns_by_table = {}
+        self.fks_by_table = {}
+        self.indexes_by_table = {}
+        self.auto_inc_by_table = {}
+
+        # Columns, shaped like DESCRIBE rows so downstream parsing is unchanged
+        mysql_meta_cursor.execute("""
+            SELECT
+                TABLE_NAME,
+                COLUMN_NAME,
+                COLUMN_TYPE,
+                IS_NULLABLE,
+                COLUMN_KEY,
+                COLUMN_DEFAULT,
+                EXTRA
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = %s
+            ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """, (db_name,))
+        for table, col_name, col_type, nullable, key, default, extra in mysql_meta_cursor.fetchall():
+            column = {
+                'Field': col_name,
+                'Type': col_type,
+                'Null': nullable,
+                'Key': key,
+                'Default': default,
+                'Extra': extra or ''
+            }
+            self.columns_by_table.setdefault(table, []).append(column)
+            if 'auto_increment' in column['Extra']:
+                self.auto_inc_by_table.setdefault(table, []).append(column['Field'])
+
+        # Foreign keys for every table in one query
+        mysql_meta_cursor.execute("""
+            SELECT
+                kcu.TABLE_NAME,
+                kcu.COLUMN_NAME,
+                kcu.REFERENCED_TABLE_NAME,
+                kcu.REFERENCED_COLUMN_NAME,
+                kcu.CONSTRAINT_NAME,
+                rc.UPDATE_RULE,
+                rc.DELETE_RULE
+            FROM
+                INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+            LEFT JOIN
+                INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS rc
+                ON kcu.CONSTRAINT_NAME = rc.CONSTRAINT_NAME
+                AND kcu.TABLE_SCHEMA = rc.CONSTRAINT_SCHEMA
+            WHERE
+                kcu.TABLE_SCHEMA = %s AND
+                kcu.REFERENCED_TABLE_NAME IS NOT NULL
+            ORDER BY kcu.TABLE_NAME
+        """, (db_name,))
+        for (table, col_name, ref_table, ref_col, constraint,
+             update_rule, delete_rule) in mysql_meta_cursor.fetchall():
+            self.fks_by_table.setdefault(table, []).append({
+                'TABLE_NAME': table,
+                'COLUMN_NAME': col_name,
+                'REFERENCED_TABLE_NAME': ref_table,
+                'REFERENCED_COLUMN_NAME': ref_col,
+                'CONSTRAINT_NAME': constraint,
+                'UPDATE_RULE': update_rule,
+                'DELETE_RULE': delete_rule
+            })
+
+        # Indexes and unique constraints for every table in one query
+        mysql_meta_cursor.execute("""
+            SELECT DISTINCT
+                TABLE_NAME,
+                INDEX_NAME,
+                COLUMN_NAME,
+                NON_UNIQUE,
+                INDEX_TYPE,
+                SEQ_IN_INDEX
+            FROM
+                INFORMATION_SCHEMA.STATISTICS
+            WHERE
+                TABLE_SCHEMA = %s AND
+                INDEX_NAME != 'PRIMARY'
+            ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+        """, (db_name,))
+        for table, idx_name, col_name, non_unique, idx_type, _ in mysql_meta_cursor.fetchall():
+            table_indexes = self.indexes_by_table.setdefault(table, {})
+            if idx_name not in table_indexes:
+                table_indexes[idx_name] = {
+                    'columns': [],
+                    'unique': non_unique == 0,
+                    'type': idx_type
+                }
+            table_indexes[idx_name]['columns'].append(col_name)
+
+def get_table_schema(schema_cache, table_name):
+    """
+    Get the schema definition for a MySQL table from the schema cache
+    Returns column definitions and primary keys with preserved case
+    """
+    columns = schema_cache.columns_by_table.get(table_name, [])
+
+    column_defs = []
+    primary_keys = []
+    column_mapping = {}  # To track original column names to preserve case
+    
+    for column in columns:
+        col_name = column['Field']
+        col_type = column['Type']
+        col_null = column['Null']
+        col_key = column['Key']
+        col_default = column['Default']
+        col_extra = column['Extra']
+        
+        # Store original column name for case preservation
+        column_mapping[col_name.lower()] = col_name
+        
+        # Extract base type (e.g., varchar from varchar(255))
+        base_type = re.match(r'(\w+)', col_type.lower()).group(1)
+        
+        # Map MySQL type to PostgreSQL type
+        pg_type = TYPE_MAPPING.get(base_type, 'TEXT')
+        
+        # Handle size for types like varchar, char, etc.
+        if '(' in col_type and base_type in ['varchar', 'char', 'decimal', 'numeric']:
+            size = re.search(r'\((.*?)\)', col_type).group(1)
+            pg_type += f"({size})"
+        
+        # Handle auto_increment
+        if 'auto_increment' in col_extra:
+            pg_type = AUTO_INCREMENT_PROMOTION.get(pg_type, pg_type)
+        
+        # Build column definition - use lowercase for case-insensitive behavior
+        column_def = f'{col_name.lower()} {pg_type}'
+        
+        # Add NOT NULL constraint if needed
+        if col_null == 'NO':
+            column_def += " NOT NULL"
+        
+        # Add default value if present and not auto_increment
+        if col_default is not None and 'auto_increment' not in col_extra:
+            if col_default == 'CURRENT_TIMESTAMP':
+                column_def += " DEFAULT CURRENT_TIMESTAMP"
+            elif base_type in ['char', 'varchar', 'text', 'enum']:
+                # Escape single quotes in default values to prevent SQL injection
+                escaped_default = col_default.replace("'", "''")
+                column_def += f" DEFAULT '{escaped_default}'"
+            else:
+                # For numeric defaults, validate they're safe
+                try:
+                    float(col_default)  # Test if it's a valid number
+                    column_def += f" DEFAULT {col_default}"
+                except ValueError:
+                    # If not a valid number, treat as string
+                    escaped_default = col_default.replace("'", "''")
+                    column_def += f" DEFAULT '{escaped_default}'"
+        
+        column_defs.append(column_def)
+        
+        # Track primary keys - use lowercase for case-insensitive behavior
+        if col_key == "PRI":
+            primary_keys.append(col_name.lower())
+    
+    return column_defs, primary_keys, column_mapping
+
+def get_foreign_keys(schema_cache, table_name):
+    """
+    Get foreign key relationships for a MySQL table from the schema cache
+    Returns a list of foreign key definitions with preserved case and actions
+    """
+    return schema_cache.fks_by_table.get(table_name, [])
+
+def get_table_dependencies(schema_cache):
+    """
+    Get table dependency order to ensure proper migration sequence
+    Builds the dependency graph from the cached foreign keys instead of
+    issuing another KEY_COLUMN_USAGE query, and hands it to the stdlib
+    graphlib.TopologicalSorter, whose get_ready batches are exactly the
+    dependency levels the parallel data pass consumes
+    Returns tables ordered by dependency (parent tables first) and
+    dependency levels (tables in the same level are independent and
+    can be migrated concurrently)
+    Handles circular dependencies by breaking them
+    """
+    all_tables = schema_cache.tables
+    known = set(all_tables)
+
+    # predecessors[child] = parents the child's foreign keys point at
+    predecessors = {table: set() for table in all_tables}
+    for child, fks in schema_cache.fks_by_table.items():
+        for fk in fks:
+            parent = fk['REFERENCED_TABLE_NAME']
+            if parent in known and child != parent:  # Avoid self-references
+                predecessors[child].add(parent)
+
+    # Peel off any circular dependencies first; TopologicalSorter refuses
+    # to order a cyclic graph, and those tables migrate last as before
+    remaining_tables = []
+    while True:
+        sorter = graphlib.TopologicalSorter(
+            {table: parents for table, parents in predecessors.items()}
+        )
+        try:
+            sorter.prepare()
+            break
+        except graphlib.CycleError as cycle_err:
+            # The reported cycle repeats its starting node - deduplicate
+            cycle = [table for table in dict.fromkeys(cycle_err.args[1])
+                     if table in predecessors]
+            for table in cycle:
+                remaining_tables.append(table)
+                del predecessors[table]
+            for parents in predecessors.values():
+                parents.difference_update(cycle)
+
+    ordered_tables = []
+    levels = []
+    while sorter.is_active():
+        # Keep the stable SHOW TABLES order within each level
+        ready = set(sorter.get_ready())
+        level = [table for table in all_tables if table in ready]
+        levels.append(level)
+        ordered_tables.extend(level)
+        sorter.done(*level)
+
+    if remaining_tables:
+        logging.warning(f"⚠ Circular dependencies detected. Adding remaining tables: {remaining_tables}")
+        ordered_tables.extend(remaining_tables)
+        levels.append(remaining_tables)
+
+    return ordered_tables, levels
+
+def build_create_table_sql(table_name, schema, pkeys, unlogged=True):
+    """
+    Build the DROP + CREATE DDL for one PostgreSQL table
+    Returns a composed SQL fragment so the caller can batch the DDL for
+    every table into a single execute (one round trip for the whole pass)
+    Tables are created UNLOGGED by default so the bulk load skips WAL,
+    then switched to LOGGED after migration (see set_tables_logged)
+    Uses lowercase table names for case-insensitive behavior
+    Uses proper SQL identifier escaping for security
+    """
+    # Use lowercase table name for case-insensitive behavior
+    # Use proper SQL identifier escaping
+    drop_query = psycopg2.sql.SQL("DROP TABLE IF EXISTS {} CASCADE").format(
+        psycopg2.sql.Identifier(table_name.lower())
+    )
+
+    # Build CREATE TABLE query with proper escaping
+    schema_sql = psycopg2.sql.SQL(", ").join([
+        psycopg2.sql.SQL(col_def) for col_def in schema
+    ])
+
+    create_template = "CREATE UNLOGGED TABLE" if unlogged else "CREATE TABLE"
+
+    if pkeys:
+        pkeys_sql = psycopg2.sql.SQL(", ").join([
+            psycopg2.sql.Identifier(pk) for pk in pkeys
+        ])
+        create_query = psycopg2.sql.SQL(create_template + " {} ({}, PRIMARY KEY ({}))").format(
+            psycopg2.sql.Identifier(table_name.lower()),
+            schema_sql,
+            pkeys_sql
+        )
+    else:
+        create_query = psycopg2.sql.SQL(create_template + " {} ({})").format(
+            psycopg2.sql.Identifier(table_name.lower()),
+            schema_sql
+        )
+
+    return psycopg2.sql.SQL("; ").join([drop_query, create_query])
+
+def set_tables_logged(pg_cursor, tables):
+    """
+    Switch UNLOGGED tables back to LOGGED after the bulk load
+    This writes the data to WAL once, instead of once per batch during
+    the load; a crash mid-migration simply requires a restart
+    Must run before foreign keys exist: PostgreSQL rejects SET LOGGED
+    on a table whose FK references a still-unlogged table, which would
+    deadlock mutually-referencing tables
+    Each ALTER runs under a savepoint so one failure cannot abort the
+    surrounding transaction
+    """
+    for table in tables:
+        pg_cursor.execute("SAVEPOINT set_logged")
+        try:
+            query = psycopg2.sql.SQL("ALTER TABLE {} SET LOGGED").format(
+                psycopg2.sql.Identifier(table.lower())
+            )
+            pg_cursor.execute(query)
+            pg_cursor.execute("RELEASE SAVEPOINT set_logged")
+            logging.info(f"✅ Set table to LOGGED: {table.lower()}")
+        except Exception as e:
+            pg_cursor.execute("ROLLBACK TO SAVEPOINT set_logged")
+            logging.warning(f"⚠ Could not set table {table} to LOGGED: {e}")
+
+def add_foreign_keys(pg_cursor, table_name, foreign_keys):
+    """
+    Add foreign key constraints to a PostgreSQL table
+    Constraints are registered NOT VALID so ADD CONSTRAINT is O(1)
+    instead of scanning the child table; validate_table_constraints
+    performs the scans concurrently afterwards
+    Returns the names of the constraints that were added
+    Uses lowercase identifiers for case-insensitive behavior
+    Uses proper SQL identifier escaping for security
+    """
+    statements = []
+
+    for fk in foreign_keys:
+        column_name = fk['COLUMN_NAME'].lower()
+        ref_table = fk['REFERENCED_TABLE_NAME'].lower()
+        ref_column = fk['REFERENCED_COLUMN_NAME'].lower()
+        update_rule = fk.get('UPDATE_RULE', 'RESTRICT')
+        delete_rule = fk.get('DELETE_RULE', 'RESTRICT')
+        
+        constraint_name = f"fk_{table_name.lower()}_{column_name}"
+
+        pg_update_action = FK_ACTION_MAPPING.get(update_rule, 'RESTRICT')
+        pg_delete_action = FK_ACTION_MAPPING.get(delete_rule, 'RESTRICT')
+        
+        # Use proper SQL identifier escaping
+        query = psycopg2.sql.SQL("""
+            ALTER TABLE {}
+            ADD CONSTRAINT {}
+            FOREIGN KEY ({})
+            REFERENCES {} ({})
+            ON UPDATE {}
+            ON DELETE {}
+            DEFERRABLE INITIALLY DEFERRED
+            NOT VALID
+        """).format(
+            psycopg2.sql.Identifier(table_name.lower()),
+            psycopg2.sql.Identifier(constraint_name),
+            psycopg2.sql.Identifier(column_name),
+            psycopg2.sql.Identifier(ref_table),
+            psycopg2.sql.Identifier(ref_column),
+            psycopg2.sql.SQL(pg_update_action),
+            psycopg2.sql.SQL(pg_delete_action)
+        )
+        statements.append((query, constraint_name,
+                           f"foreign key {constraint_name} (UPDATE: {pg_update_action}, DELETE: {pg_delete_action})"))
+
+    if not statements:
+        return []
+
+    # Send all FK DDL for the table in one execute to avoid a
+    # round-trip per constraint, mirroring the index DDL path
+    added = []
+    pg_cursor.execute("SAVEPOINT fk_ddl")
+    try:
+        pg_cursor.execute(psycopg2.sql.SQL("; ").join(query for query, _, _ in statements))
+        pg_cursor.execute("RELEASE SAVEPOINT fk_ddl")
+        for _, constraint_name, description in statements:
+            added.append(constraint_name)
+            logging.info(f"✅ Added {description}")
+    except Exception as batch_err:
+        # Retry one at a time so the offending constraint can be logged and skipped
+        pg_cursor.execute("ROLLBACK TO SAVEPOINT fk_ddl")
+        logging.warning(f"⚠ Batched foreign key DDL failed for {table_name}, retrying individually: {batch_err}")
+        for query, constraint_name, description in statements:
+            pg_cursor.execute("SAVEPOINT fk_stmt")
+            try:
+                pg_cursor.execute(query)
+                pg_cursor.execute("RELEASE SAVEPOINT fk_stmt")
+                added.append(constraint_name)
+                logging.info(f"✅ Added {description}")
+            except Exception as e:
+                pg_cursor.execute("ROLLBACK TO SAVEPOINT fk_stmt")
+                logging.warning(f"⚠ Could not add {description}: {e}")
+
+    return added
+
+def validate_table_constraints(pg_pool, table_name, constraint_names):
+    """
+    Validate NOT VALID foreign keys for one table on a pooled connection
+    The verification scans for different tables are independent, so they
+    run concurrently like the data and index work
+    """
+    pg_conn = pg_pool.getconn()
+    pg_cursor = None
+    try:
+        pg_cursor = pg_conn.cursor()
+        for constraint_name in constraint_names:
+            try:
+                query = psycopg2.sql.SQL("ALTER TABLE {} VALIDATE CONSTRAINT {}").format(
+                    psycopg2.sql.Identifier(table_name.lower()),
+                    psycopg2.sql.Identifier(constraint_name)
+                )
+                pg_cursor.execute(query)
+                pg_conn.commit()
+                logging.info(f"✅ Validated constraint {constraint_name}")
+            except Exception as e:
+                pg_conn.rollback()
+                logging.error(f"❌ Validation failed for {constraint_name} on {table_name}: {e}")
+    finally:
+        if pg_cursor:
+            pg_cursor.close()
+        pg_pool.putconn(pg_conn)
+
+def get_indexes_and_constraints(schema_cache, table_name):
+    """
+    Get indexes and unique constraints for a MySQL table from the schema cache
+    """
+    return schema_cache.indexes_by_table.get(table_name, {})
+
+def create_indexes_and_constraints(pg_cursor, table_name, indexes):
+    """
+    Create indexes and unique constraints in PostgreSQL
+    Uses lowercase identifiers for case-insensitive behavior
+    Uses proper SQL identifier escaping for security
+    """
+    statements = []
+
+    for idx_name, idx_info in indexes.items():
+        columns = [col.lower() for col in idx_info['columns']]
+        column_identifiers = [psycopg2.sql.Identifier(col) for col in columns]
+
+        if idx_info['unique']:
+            # Create unique constraint
+            constraint_name = f"uk_{table_name.lower()}_{idx_name.lower()}"
+            query = psycopg2.sql.SQL("ALTER TABLE {} ADD CONSTRAINT {} UNIQUE ({})").format(
+                psycopg2.sql.Identifier(table_name.lower()),
+                psycopg2.sql.Identifier(constraint_name),
+                psycopg2.sql.SQL(", ").join(column_identifiers)
+            )
+            statements.append((query, f"unique constraint {constraint_name}"))
+        else:
+            # Create regular index
+            index_name = f"idx_{table_name.lower()}_{idx_name.lower()}"
+            query = psycopg2.sql.SQL("CREATE INDEX {} ON {} ({})").format(
+                psycopg2.sql.Identifier(index_name),
+                psycopg2.sql.Identifier(table_name.lower()),
+                psycopg2.sql.SQL(", ").join(column_identifiers)
+            )
+            statements.append((query, f"index {index_name}"))
+
+    if not statements:
+        return
+
+    # Send all DDL for the table in one execute; each statement is a
+    # synchronous round-trip otherwise
+    pg_cursor.execute("SAVEPOINT index_ddl")
+    try:
+        pg_cursor.execute(psycopg2.sql.SQL("; ").join(query for query, _ in statements))
+        pg_cursor.execute("RELEASE SAVEPOINT index_ddl")
+        for _, description in statements:
+            logging.info(f"✅ Created {description}")
+    except Exception as batch_err:
+        # Retry one at a time so the offending statement can be logged and skipped
+        pg_cursor.execute("ROLLBACK TO SAVEPOINT index_ddl")
+        logging.warning(f"⚠ Batched index DDL failed for {table_name}, retrying individually: {batch_err}")
+        for query, description in statements:
+            pg_cursor.execute("SAVEPOINT index_stmt")
+            try:
+                pg_cursor.execute(query)
+                pg_cursor.execute("RELEASE SAVEPOINT index_stmt")
+                logging.info(f"✅ Created {description}")
+            except Exception as e:
+                pg_cursor.execute("ROLLBACK TO SAVEPOINT index_stmt")
+                logging.warning(f"⚠ Could not create {description}: {e}")
+
+def update_sequences(pg_cursor, tables, schema_cache, auto_inc_maxes):
+    """
+    Update PostgreSQL sequences to continue from the highest migrated value
+    This fixes the auto-increment reset issue
+    auto_inc_maxes carries the per-table maxima tracked during the data
+    load; MAX scans are only issued for columns missing from it
+    The whole pass takes three round trips regardless of table count:
+    one sequence-name lookup, one combined MAX query, one combined setval
+    Uses proper SQL identifier escaping for security
+    """
+    columns = [
+        (table, col)
+        for table in tables
+        for col in schema_cache.auto_inc_by_table.get(table, [])
+    ]
+    if not columns:
+        return
+
+    # Ask PostgreSQL for the authoritative sequence names instead of
+    # guessing naming conventions - every wrong guess aborted the
+    # transaction and forced a rollback
+    pg_cursor.execute(
+        "SELECT tbl, col, pg_get_serial_sequence(tbl, col) FROM (VALUES "
+        + ", ".join(["(%s, %s)"] * len(columns))
+        + ") AS t(tbl, col)",
+        [v for table, col in columns for v in (table.lower(), col.lower())]
+    )
+    seq_names = {(tbl, col): seq for tbl, col, seq in pg_cursor.fetchall()}
+
+    # Scan for maxima only where the data load didn't track one, and do
+    # it in a single combined query
+    maxima = {
+        (table.lower(), col.lower()): (auto_inc_maxes.get(table) or {}).get(col)
+        for table, col in columns
+        if col in (auto_inc_maxes.get(table) or {})
+    }
+    missing = [(table, col) for table, col in columns
+               if (table.lower(), col.lower()) not in maxima]
+    if missing:
+        max_query = psycopg2.sql.SQL(" UNION ALL ").join(
+            psycopg2.sql.SQL("SELECT {} AS tbl, {} AS col, MAX({}) FROM {}").format(
+                psycopg2.sql.Literal(table.lower()),
+                psycopg2.sql.Literal(col.lower()),
+                psycopg2.sql.Identifier(col.lower()),
+                psycopg2.sql.Identifier(table.lower())
+            )
+            for table, col in missing
+        )
+        pg_cursor.execute(max_query)
+        for tbl, col, max_val in pg_cursor.fetchall():
+            maxima[(tbl, col)] = max_val
+
+    setvals = []
+    for table, col in columns:
+        key = (table.lower(), col.lower())
+        seq_name = seq_names.get(key)
+        max_val = maxima.get(key)
+        if max_val is None:
+            continue
+        if seq_name:
+            setvals.append((seq_name, max_val))
+        else:
+            logging.warning(f"⚠ No sequence found for {table}.{col}")
+
+    if not setvals:
+        return
+
+    try:
+        pg_cursor.execute(
+            "SELECT " + ", ".join(["setval(%s, %s, true)"] * len(setvals)),
+            [v for seq_name, max_val in setvals for v in (seq_name, max_val)]
+        )
+        for seq_name, max_val in setvals:
+            logging.info(f"✅ Updated sequence {seq_name} to start from {max_val + 1}")
+    except Exception as e:
+        logging.error(f"❌ Failed to update sequences: {e}")
+
+def validate_all_tables(mysql_pool, pg_pool, tables, row_counts):
+    """
+    Deferred integrity check: compare MySQL and PostgreSQL row counts
+    for every table in one pass at the end of the migration
+    Counts cached during the load cover the common case; any missing
+    side is gathered with a single UNION ALL query, and the two
+    databases are queried concurrently on separate connections
+    Raises if any table's counts differ
+    """
+    missing_mysql = [t for t in tables if 'mysql' not in row_counts.get(t, {})]
+    missing_pg = [t for t in tables if 'pg' not in row_counts.get(t, {})]
+
+    def count_mysql_side():
+        if not missing_mysql:
+            return
+        mysql_conn = mysql_pool.get_connection()
+        try:
+            mysql_cursor = mysql_conn.cursor(buffered=True)
+            mysql_cursor.execute(" UNION ALL ".join(
+                f"SELECT '{table}', COUNT(*) FROM `{table}`"
+                for table in missing_mysql
+            ))
+            for table, count in mysql_cursor.fetchall():
+                row_counts.setdefault(table, {})['mysql'] = count
+            mysql_cursor.close()
+        finally:
+            mysql_conn.close()
+
+    def count_pg_side():
+        if not missing_pg:
+            return
+        pg_conn = pg_pool.getconn()
+        try:
+            pg_cursor = pg_conn.cursor()
+            count_query = psycopg2.sql.SQL(" UNION ALL ").join(
+                psycopg2.sql.SQL("SELECT {}, COUNT(*) FROM {}").format(
+                    psycopg2.sql.Literal(table),
+                    psycopg2.sql.Identifier(table.lower())
+                )
+                for table in missing_pg
+            )
+            pg_cursor.execute(count_query)
+            for table, count in pg_cursor.fetchall():
+                row_counts.setdefault(table, {})['pg'] = count
+            pg_cursor.close()
+            pg_conn.rollback()
+        finally:
+            pg_pool.putconn(pg_conn)
+
+    # Let both databases count at the same time
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        for future in [executor.submit(count_mysql_side), executor.submit(count_pg_side)]:
+            future.result()  # Re-raises worker exceptions
+
+    mismatched = []
+    for table in tables:
+        counts = row_counts.get(table, {})
+        mysql_count = counts.get('mysql')
+        pg_count = counts.get('pg')
+        if mysql_count == pg_count:
+            logging.info(f"✅ Row count validated for {table}: {pg_count} rows")
+        else:
+            logging.error(f"❌ Row count mismatch in {table}: MySQL={mysql_count}, PostgreSQL={pg_count}")
+            mismatched.append(table)
+
+    if mismatched:
+        raise Exception(f"Data validation failed for tables: {', '.join(mismatched)}")
+
+def format_text_value(value):
+    """
+    Format a single value for a text-format COPY stream
+    None becomes \\N, strings escape only the four special characters
+    via str.translate, bytes become escaped PostgreSQL hex format
+    """
+    if value is None:
+        return '\\N'
+    if isinstance(value, str):
+        return value.translate(COPY_TEXT_ESCAPE)
+    if isinstance(value, bytes):
+        return '\\\\x' + value.hex()
+    return str(value)
+
+def insert_batch_bisect(pg_cursor, insert_query, values_query, batch, table_name, progress):
+    """
+    Insert a failed COPY batch by recursive bisection
+    Halving the batch until the offending rows are isolated costs
+    O(log n) retries for a single bad row instead of n per-row commits
+    Multi-row attempts go through execute_values, which sends one
+    multi-VALUES INSERT per try instead of execute_batch's pages of 100
+    Uses savepoints so a failed half does not abort the transaction
+    Returns the number of rows inserted
+    """
+    if not batch:
+        return 0
+
+    if len(batch) == 1:
+        pg_cursor.execute("SAVEPOINT batch_retry")
+        try:
+            pg_cursor.execute(insert_query, batch[0])
+            pg_cursor.execute("RELEASE SAVEPOINT batch_retry")
+            progress.update(1)
+            return 1
+        except Exception as row_err:
+            pg_cursor.execute("ROLLBACK TO SAVEPOINT batch_retry")
+            logging.warning(f"⚠ Failed row insert in {table_name}: {row_err}")
+            return 0
+
+    pg_cursor.execute("SAVEPOINT batch_retry")
+    try:
+        psycopg2.extras.execute_values(pg_cursor, values_query, batch, page_size=len(batch))
+        pg_cursor.execute("RELEASE SAVEPOINT batch_retry")
+        progress.update(len(batch))
+        return len(batch)
+    except Exception:
+        pg_cursor.execute("ROLLBACK TO SAVEPOINT batch_retry")
+        mid = len(batch) // 2
+        inserted = insert_batch_bisect(pg_cursor, insert_query, values_query,
+                                       batch[:mid], table_name, progress)
+        inserted += insert_batch_bisect(pg_cursor, insert_query, values_query,
+                                        batch[mid:], table_name, progress)
+        return inserted
+
+class CopyStream(io.RawIOBase):
+    """
+    File-like adapter that turns a streaming MySQL cursor into the
+    text-format byte stream copy_expert reads, so an entire table flows through one
+    COPY with O(1) buffering instead of one COPY per flush window
+    Applies the same per-column transforms and auto-increment tracking
+    as the batched path while rows stream past
+    """
+
+    FETCH_ROWS = 1024
+
+    def __init__(self, mysql_data_cursor, transforms, auto_inc_indexes,
+                 auto_inc_max, table_name, progress):
+        self._cursor = mysql_data_cursor
+        self._transforms = transforms
+        self._auto_inc_indexes = auto_inc_indexes
+        self._auto_inc_max = auto_inc_max
+        self._table_name = table_name
+        self._progress = progress
+        self._buffer = bytearray()
+        self._exhausted = False
+        self.rows_read = 0
+
+    def readable(self):
+        return True
+
+    def _fill(self):
+        rows = self._cursor.fetchmany(self.FETCH_ROWS)
+        if not rows:
+            self._exhausted = True
+            return
+        lines = []
+        for row in rows:
+            try:
+                values = tuple(tf(v) for tf, v in zip(self._transforms, row))
+            except Exception as e:
+                logging.warning(f"Skipping row in {self._table_name} due to sanitization error: {e}")
+                continue
+            for idx, col in self._auto_inc_indexes.items():
+                value = values[idx]
+                if value is not None and (self._auto_inc_max[col] is None or value > self._auto_inc_max[col]):
+                    self._auto_inc_max[col] = value
+            lines.append("\t".join(map(format_text_value, values)))
+            lines.append("\n")
+            self.rows_read += 1
+        self._buffer += "".join(lines).encode()
+        self._progress.update(len(rows))
+
+    def read(self, size=-1):
+        while not self._exhausted and (size < 0 or len(self._buffer) < size):
+            self._fill()
+        if size < 0 or size >= len(self._buffer):
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+        return data
+
+def flush_copy_buffer(pg_cursor, copy_query, insert_query, values_query, copy_buffer,
+                      sanitized_batch, table_name, progress):
+    """
+    Send the accumulated text-format buffer to PostgreSQL via COPY
+    Runs under a savepoint so a rejected batch can fall back to
+    bisecting INSERTs without touching earlier flushes - the whole
+    table commits once, at the end of migrate_table_data
+    Returns the number of rows inserted
+    """
+    copy_buffer.seek(0)
+    pg_cursor.execute("SAVEPOINT copy_flush")
+    try:
+        pg_cursor.copy_expert(copy_query, copy_buffer)
+        pg_cursor.execute("RELEASE SAVEPOINT copy_flush")
+        progress.update(len(sanitized_batch))
+        return len(sanitized_batch)
+    except Exception as batch_err:
+        logging.error(f"❌ COPY error in {table_name}: {batch_err}")
+        pg_cursor.execute("ROLLBACK TO SAVEPOINT copy_flush")
+
+        # Bisect the batch to isolate the offending rows
+        return insert_batch_bisect(
+            pg_cursor, insert_query, values_query, sanitized_batch, table_name, progress
+        )
+
+def migrate_table_batched(mysql_data_cursor, pg_cursor, copy_query, insert_query,
+                          values_query, transforms, auto_inc_indexes, auto_inc_max,
+                          table_name, progress):
+    """
+    Fallback data path: flush the text-format buffer through COPY every
+    COPY_FLUSH_ROWS rows so a rejected batch can be bisected down to
+    the offending rows without abandoning the table
+    Returns the number of rows inserted; auto_inc_max is updated in place
+    """
+    batch_size = COPY_FLUSH_ROWS
+    copy_buffer = io.StringIO()
+    sanitized_batch = []  # Retained per flush only for the bisect fallback
+    total_inserted = 0
+
+    for row in mysql_data_cursor:
+        try:
+            values = tuple(tf(v) for tf, v in zip(transforms, row))
+        except Exception as e:
+            logging.warning(f"Skipping row in {table_name} due to sanitization error: {e}")
+            continue
+
+        for idx, col in auto_inc_indexes.items():
+            value = values[idx]
+            if value is not None and (auto_inc_max[col] is None or value > auto_inc_max[col]):
+                auto_inc_max[col] = value
+
+        sanitized_batch.append(values)
+        copy_buffer.write("\t".join(map(format_text_value, values)))
+        copy_buffer.write("\n")
+
+        if len(sanitized_batch) >= batch_size:
+            total_inserted += flush_copy_buffer(
+                pg_cursor, copy_query, insert_query, values_query,
+                copy_buffer, sanitized_batch, table_name, progress
+            )
+            # Rewind and reuse the buffer and batch list instead of
+            # reallocating them every flush
+            copy_buffer.seek(0)
+            copy_buffer.truncate(0)
+            sanitized_batch.clear()
+
+    if sanitized_batch:
+        total_inserted += flush_copy_buffer(
+            pg_cursor, copy_query, insert_query, values_query,
+            copy_buffer, sanitized_batch, table_name, progress
+        )
+
+    return total_inserted
+
+def migrate_table_data(mysql_cursor, mysql_data_cursor, pg_cursor, pg_conn, table_name,
+                       schema_cache, column_mapping=None, row_counts=None):
+    """
+    Migrate data from MySQL table to PostgreSQL table
+    Streams batches through COPY FROM STDIN instead of per-row INSERTs
+    Rows travel as tuples through a precompiled per-column transform list,
+    avoiding per-cell type dispatch and dict rebuilds
+    Preserves case by quoting all identifiers
+    Uses column_mapping to ensure case consistency
+    Returns the highest value seen per auto-increment column so
+    update_sequences can skip a full-table MAX scan afterwards
+    """
+    # Get row count for progress bar, cached for validation and reporting
+    mysql_cursor.execute(f"SELECT COUNT(*) as count FROM `{table_name}`")
+    row_count = mysql_cursor.fetchone()['count']
+
+    if row_counts is not None:
+        row_counts.setdefault(table_name, {})['mysql'] = row_count
+
+    if row_count == 0:
+        logging.info(f"⚠ No data in table: {table_name}")
+        if row_counts is not None:
+            row_counts[table_name]['pg'] = 0
+        return {}
+
+    # Compile per-column transforms once from the cached schema; column
+    # order in the cache matches the column order of SELECT *
+    columns = schema_cache.columns_by_table.get(table_name, [])
+    transforms = build_column_transforms(columns)
+    original_col_names = [column['Field'] for column in columns]
+
+    # Track the running max of each auto-increment column while the rows
+    # stream past - it's free here and saves a MAX scan per sequence later
+    auto_inc_cols = schema_cache.auto_inc_by_table.get(table_name, [])
+    auto_inc_indexes = {original_col_names.index(col): col for col in auto_inc_cols}
+    auto_inc_max = {col: None for col in auto_inc_cols}
+
+    # Stream the whole table in one query
+    # This avoids LIMIT/OFFSET pagination, which re-scans and discards
+    # offset rows on every iteration (O(N^2) total work on large tables)
+
+    # Create progress bar (throttled so terminal I/O stays off the hot path)
+    progress = tqdm(total=row_count, desc=f"Migrating {table_name}", mininterval=0.5)
+
+    # Compose and serialize the COPY/INSERT SQL once per table - rebuilding
+    # Composed objects and calling as_string per batch is wasted work
+    # Use lowercase column names for case-insensitive behavior
+    lowercase_cols = [col.lower() for col in original_col_names]
+
+    # Use proper SQL identifier escaping for table and column names
+    # Table and column names come from database schema, so we use Identifier for safety
+    table_identifier = psycopg2.sql.Identifier(table_name.lower())
+    column_identifiers = [psycopg2.sql.Identifier(col) for col in lowercase_cols]
+
+    # Build the COPY query with proper escaping for identifiers
+    # Default text format, not CSV: csv.writer leaves a cell holding the
+    # literal string \N unquoted, which COPY's CSV reader turns back
+    # into SQL NULL - text-format escaping round-trips every string
+    copy_query_str = psycopg2.sql.SQL("COPY {} ({}) FROM STDIN").format(
+        table_identifier,
+        psycopg2.sql.SQL(", ").join(column_identifiers)
+    ).as_string(pg_cursor)
+
+    # Build INSERT query for the row-by-row fallback path
+    placeholders_str = ', '.join(['%s'] * len(original_col_names))
+    insert_query = psycopg2.sql.SQL("INSERT INTO {} ({}) VALUES ({})").format(
+        table_identifier,
+        psycopg2.sql.SQL(", ").join(column_identifiers),
+        psycopg2.sql.SQL(placeholders_str)
+    )
+    insert_query_str = insert_query.as_string(pg_cursor)
+
+    # Build the multi-VALUES template for execute_values (the trailing %s
+    # is the execute_values placeholder, not a bind parameter)
+    values_query = psycopg2.sql.SQL("INSERT INTO {} ({}) VALUES %s").format(
+        table_identifier,
+        psycopg2.sql.SQL(", ").join(column_identifiers)
+    )
+    values_query_str = values_query.as_string(pg_cursor)
+
+    # One transaction per table: skip the WAL fsync wait on the commit and
+    # avoid publishing visibility after every batch
+    pg_cursor.execute("SET LOCAL synchronous_commit = OFF")
+
+    mysql_data_cursor.execute(f"SELECT * FROM `{table_name}`")
+
+    # Stream the entire table through a single COPY: the CopyStream
+    # adapter pulls rows off the unbuffered cursor and hands encoded bytes
+    # to copy_expert on demand, so memory stays O(1) and there is no
+    # per-flush COPY startup cost
+    stream = CopyStream(mysql_data_cursor, transforms, auto_inc_indexes,
+                        auto_inc_max, table_name, progress)
+    pg_cursor.execute("SAVEPOINT copy_stream")
+    try:
+        pg_cursor.copy_expert(copy_query_str, stream)
+        pg_cursor.execute("RELEASE SAVEPOINT copy_stream")
+        total_inserted = stream.rows_read
+    except Exception as stream_err:
+        # A rejected row aborts the whole COPY, so rewind and rerun the
+        # table through the batched path, which can bisect around bad rows
+        logging.error(f"❌ Streaming COPY failed for {table_name}, retrying in batches: {stream_err}")
+        pg_cursor.execute("ROLLBACK TO SAVEPOINT copy_stream")
+        for col in auto_inc_max:
+            auto_inc_max[col] = None
+        progress.reset()
+        try:
+            # Drain what the failed COPY left unread, window by window -
+            # fetchall would materialize the rest of the table in memory
+            while mysql_data_cursor.fetchmany(COPY_FLUSH_ROWS):
+                pass
+        except Exception:
+            pass
+        mysql_data_cursor.execute(f"SELECT * FROM `{table_name}`")
+        total_inserted = migrate_table_batched(
+            mysql_data_cursor, pg_cursor, copy_query_str, insert_query_str,
+            values_query_str, transforms, auto_inc_indexes, auto_inc_max,
+            table_name, progress
+        )
+
+    # Single commit for the whole table
+    pg_conn.commit()
+
+    progress.close()
+    logging.info(f"✅ Migrated {total_inserted} of {row_count} records from {table_name}")
+
+    # The table was created empty this run, so the inserted count is the
+    # PostgreSQL row count - no COUNT scan needed for validation
+    if row_counts is not None:
+        row_counts[table_name]['pg'] = total_inserted
+
+    return auto_inc_max
+
+def create_connection_pools(credentials):
+    """
+    Create MySQL and PostgreSQL connection pools for the migration
+    Pooling amortizes the per-connection TLS/auth handshake across
+    tables instead of paying it once per worker invocation
+    """
+    try:
+        # Force the C-extension protocol parser; it is several times
+        # faster than the pure-Python implementation on wide rows
+        mysql_pool = mysql.connector.pooling.MySQLConnectionPool(
+            pool_name="migration_mysql",
+            pool_size=MAX_PARALLEL_TABLES + 1,  # Workers plus the main cursor
+            use_pure=False,
+            **credentials["mysql"]
+        )
+    except (ImportError, mysql.connector.Error) as e:
+        logging.warning(f"⚠ C extension unavailable ({e}), falling back to pure-Python protocol")
+        mysql_pool = mysql.connector.pooling.MySQLConnectionPool(
+            pool_name="migration_mysql",
+            pool_size=MAX_PARALLEL_TABLES + 1,
+            use_pure=True,
+            **credentials["mysql"]
+        )
+    pg_pool = psycopg2.pool.ThreadedConnectionPool(
+        4,
+        MAX_PARALLEL_TABLES + 1,
+        **credentials["postgres"]
+    )
+    return mysql_pool, pg_pool
+
+def tune_pg_session(pg_conn):
+    """
+    Per-connection client tuning applied to every borrowed PG connection
+    Pins the client encoding and silences NOTICE traffic, which psycopg2
+    otherwise processes in Python per statement
+    """
+    pg_conn.set_client_encoding('UTF8')
+    with pg_conn.cursor() as cursor:
+        cursor.execute("SET client_min_messages = WARNING")
+    pg_conn.commit()
+
+def migrate_single_table(mysql_pool, pg_pool, table_name, schema_cache, column_mapping,
+                         row_counts=None):
+    """
+    Migrate and index one table using pooled connections
+    Designed to run as a worker so tables in the same dependency level
+    can be migrated concurrently without sharing cursors; row-count
+    validation is deferred to validate_all_tables at the end of the run
+    Returns the per-column auto-increment maxima from the data pass
+    """
+    mysql_conn = mysql_pool.get_connection()
+    pg_conn = pg_pool.getconn()
+    mysql_cursor = None
+    pg_cursor = None
+
+    mysql_data_cursor = None
+
+    try:
+        # Buffered dict cursor for small metadata results; the data cursor
+        # stays unbuffered so tables larger than RAM stream row by row
+        mysql_cursor = mysql_conn.cursor(dictionary=True, buffered=True)
+        # Plain tuple cursor for the data path - dict rows cost one
+        # allocation per row and the column order is known from DESCRIBE
+        mysql_data_cursor = mysql_conn.cursor()
+        tune_pg_session(pg_conn)
+        pg_cursor = pg_conn.cursor()
+        pg_conn.autocommit = False
+
+        # Bulk-load tuning: 'replica' role skips trigger and FK firing for
+        # this session while the data streams in (constraints are added and
+        # validated after the load, pgloader-style)
+        pg_cursor.execute("SET session_replication_role = 'replica'")
+        pg_conn.commit()
+
+        auto_inc_max = migrate_table_data(mysql_cursor, mysql_data_cursor, pg_cursor, pg_conn,
+                                          table_name, schema_cache, column_mapping, row_counts)
+
+        # Build this table's indexes right here, on the connection that
+        # just loaded it - one visit per table instead of a separate
+        # index pass, and index builds overlap other tables' loads
+        indexes = get_indexes_and_constraints(schema_cache, table_name)
+        if indexes:
+            # Give the sort phase of each index build more memory than the
+            # server default so large tables avoid spilling to disk
+            pg_cursor.execute("SET LOCAL maintenance_work_mem = '256MB'")
+            create_indexes_and_constraints(pg_cursor, table_name, indexes)
+            pg_conn.commit()
+
+        return auto_inc_max
+    finally:
+        # Restore session defaults before the connection goes back to the pool
+        try:
+            pg_conn.rollback()
+            pg_cursor.execute("SET session_replication_role = 'origin'")
+            pg_conn.commit()
+        except Exception as e:
+            logging.warning(f"⚠ Could not reset session for {table_name}: {e}")
+        try:
+            if mysql_cursor:
+                mysql_cursor.close()
+            if mysql_data_cursor:
+                mysql_data_cursor.close()
+            if pg_cursor:
+                pg_cursor.close()
+        except Exception as e:
+            logging.warning(f"⚠ Error closing cursors for {table_name}: {e}")
+        mysql_conn.close()  # Returns the connection to the pool
+        pg_pool.putconn(pg_conn)
+
+def generate_migration_report(mysql_cursor, pg_cursor, tables, schema_cache, row_counts=None):
+    """
+    Generate a comprehensive migration report
+    Reuses row counts and schema metadata cached during migration;
+    tables missing from the count cache are counted directly
+    """
+    report = []
+    report.append("=" * 60)
+    report.append("MIGRATION REPORT")
+    report.append("=" * 60)
+
+    total_mysql_rows = 0
+    total_pg_rows = 0
+
+    # Collect counts missing from the cache in one combined query per
+    # side instead of one COUNT round trip per table
+    mysql_counts = {}
+    pg_counts = {}
+    if row_counts is not None:
+        for table, cached in row_counts.items():
+            if 'mysql' in cached:
+                mysql_counts[table] = cached['mysql']
+            if 'pg' in cached:
+                pg_counts[table] = cached['pg']
+
+    missing_mysql = [table for table in tables if table not in mysql_counts]
+    if missing_mysql:
+        mysql_cursor.execute(" UNION ALL ".join(
+            f"SELECT '{table}' as table_name, COUNT(*) as count FROM `{table}`"
+            for table in missing_mysql
+        ))
+        for row in mysql_cursor.fetchall():
+            mysql_counts[row['table_name']] = row['count']
+
+    missing_pg = [table for table in tables if table not in pg_counts]
+    if missing_pg:
+        count_query = psycopg2.sql.SQL(" UNION ALL ").join(
+            psycopg2.sql.SQL("SELECT {} AS table_name, COUNT(*) FROM {}").format(
+                psycopg2.sql.Literal(table),
+                psycopg2.sql.Identifier(table.lower())
+            )
+            for table in missing_pg
+        )
+        pg_cursor.execute(count_query)
+        for table_name, count in pg_cursor.fetchall():
+            pg_counts[table_name] = count
+
+    for table in tables:
+        mysql_count = mysql_counts[table]
+        pg_count = pg_counts[table]
+
+        total_mysql_rows += mysql_count
+        total_pg_rows += pg_count
+        
+        status = "✅ SUCCESS" if mysql_count == pg_count else "❌ MISMATCH"
+        report.append(f"Table: {table:<30} MySQL: {mysql_count:>8} PostgreSQL: {pg_count:>8} {status}")
+        
+        # Check for auto-increment columns (already known from the schema cache)
+        auto_increment_cols = schema_cache.auto_inc_by_table.get(table, [])
+
+        if auto_increment_cols:
+            report.append(f"  Auto-increment columns: {', '.join(auto_increment_cols)}")
+    
+    report.append("-" * 60)
+    report.append(f"TOTAL RECORDS: MySQL: {total_mysql_rows:>8} PostgreSQL: {total_pg_rows:>8}")
+    report.append("=" * 60)
+    
+    return "\n".join(report)
+
+def migrate_all(credentials):
+    """
+    Main migration function that orchestrates the entire process
+    Handles case sensitivity throughout the migration
+    Fixes foreign key dependency issues and auto-increment sequences
+    """
+    mysql_pool = None
+    pg_pool = None
+    mysql_conn = None
+    mysql_cursor = None
+    pg_conn = None
+    pg_cursor = None
+
+    try:
+        # Create connection pools shared by the main pass and workers
+        logging.info("🔌 Creating MySQL and PostgreSQL connection pools...")
+        mysql_pool, pg_pool = create_connection_pools(credentials)
+
+        mysql_conn = mysql_pool.get_connection()
+        mysql_cursor = mysql_conn.cursor(dictionary=True, buffered=True)
+        logging.info("✅ MySQL connection established")
+
+        pg_conn = pg_pool.getconn()
+        tune_pg_session(pg_conn)
+        pg_cursor = pg_conn.cursor()
+        logging.info("✅ PostgreSQL connection established")
+        
+        # Start transaction
+        pg_conn.autocommit = False
+        
+        # Preload all schema metadata in a handful of bulk queries
+        logging.info("🗂️ Loading schema metadata...")
+        mysql_meta_cursor = mysql_conn.cursor(buffered=True)
+        schema_cache = SchemaCache(mysql_meta_cursor, credentials["mysql"]["database"])
+        mysql_meta_cursor.close()
+
+        # Get all tables ordered by dependency (parent tables first)
+        tables, levels = get_table_dependencies(schema_cache)
+
+        if not tables:
+            logging.warning("No tables found in MySQL.")
+            return
+
+        logging.info(f"📋 Migration order: {', '.join(tables)}")
+
+        # Store column mappings for each table to preserve case
+        column_mappings = {}
+
+        # First pass: Create all tables without foreign keys
+        # All DDL is sent in a single execute - one round trip for the
+        # whole pass instead of one per table
+        logging.info("🏗️ Creating table structures...")
+        create_statements = []
+        for table in tables:
+            schema, pkeys, col_mapping = get_table_schema(schema_cache, table)
+            create_statements.append(build_create_table_sql(table, schema, pkeys))
+            column_mappings[table] = col_mapping
+        pg_cursor.execute(psycopg2.sql.SQL("; ").join(create_statements))
+        for table in tables:
+            logging.info(f"✅ Created PostgreSQL table: {table.lower()}")
+
+
+        # Commit table creation so worker connections can see the new tables
+        pg_conn.commit()
+
+        # Second pass: Migrate data level by level
+        # Tables within a dependency level are independent, so each level
+        # is migrated concurrently on dedicated per-worker connections
+        logging.info("📦 Migrating data...")
+        auto_inc_maxes = {}  # Per-table auto-increment maxima seen during the load
+        row_counts = {}  # Per-table row counts, reused by validation and reporting
+        for level_num, level in enumerate(levels, start=1):
+            logging.info(f"--- Migrating Level {level_num}/{len(levels)}: {', '.join(level)} ---")
+            with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_PARALLEL_TABLES) as executor:
+                futures = {
+                    executor.submit(migrate_single_table, mysql_pool, pg_pool, table,
+                                    schema_cache, column_mappings[table], row_counts): table
+                    for table in level
+                }
+                # Fail fast: stop scheduling sibling tables once one fails
+                done, not_done = concurrent.futures.wait(
+                    futures, return_when=concurrent.futures.FIRST_EXCEPTION
+                )
+                for future in not_done:
+                    future.cancel()
+                for future in done:
+                    table = futures[future]
+                    auto_inc_maxes[table] = future.result()  # Re-raises worker exceptions
+                    logging.info(f"✅ Completed data migration for table: {table}")
+        
+        # Third pass: Update auto-increment sequences (batched round trips)
+        logging.info("🔄 Updating auto-increment sequences...")
+        update_sequences(pg_cursor, tables, schema_cache, auto_inc_maxes)
+
+        # Commit the sequence work before the SET LOGGED pass so a
+        # failed ALTER cannot take it down with the transaction
+        pg_conn.commit()
+
+        # Fourth pass: Switch tables from UNLOGGED to LOGGED
+        # This must precede the FK pass - SET LOGGED is rejected on a
+        # table whose foreign key references a still-unlogged table, so
+        # with constraints in place mutually-referencing tables could
+        # never switch
+        logging.info("📝 Switching tables to LOGGED...")
+        set_tables_logged(pg_cursor, tables)
+
+        # Fifth pass: Add foreign keys in reverse dependency order
+        # NOT VALID registration is O(1) per constraint; the scans happen
+        # concurrently in the validation pass below
+        logging.info("🔗 Adding foreign key constraints...")
+        fk_constraints = {}
+        for table in reversed(tables):  # Reverse order to add child constraints last
+            logging.info(f"--- Adding Foreign Keys for Table: {table} ---")
+            foreign_keys = get_foreign_keys(schema_cache, table)
+            if foreign_keys:
+                fk_constraints[table] = add_foreign_keys(pg_cursor, table, foreign_keys)
+
+        # Commit so the pooled validation connections see the constraints
+        pg_conn.commit()
+
+        # Sixth pass: Validate the NOT VALID foreign keys concurrently
+        logging.info("🔍 Validating foreign key constraints...")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_PARALLEL_TABLES) as executor:
+            validate_futures = [
+                executor.submit(validate_table_constraints, pg_pool, table, constraint_names)
+                for table, constraint_names in fk_constraints.items()
+                if constraint_names
+            ]
+            for future in concurrent.futures.as_completed(validate_futures):
+                future.result()  # Re-raises worker exceptions
+
+        # Seventh pass: Deferred data validation, both databases in parallel
+        logging.info("🔎 Validating migrated row counts...")
+        validate_all_tables(mysql_pool, pg_pool, tables, row_counts)
+
+        # Generate migration report
+        logging.info("📊 Generating migration report...")
+        report = generate_migration_report(mysql_cursor, pg_cursor, tables,
+                                           schema_cache, row_counts)
+        logging.info(f"\n{report}")
+        
+        # Commit transaction
+        pg_conn.commit()
+        logging.info("🎯 All tables migrated successfully!")
+        print("Migration completed successfully! Check migration.log for details.")
+        print(f"\n{report}")
+        
+    except mysql.connector.Error as mysql_err:
+        logging.error(f"❌ MySQL connection error: {mysql_err}")
+        print(f"Error connecting to MySQL: {mysql_err}")
+        if pg_conn:
+            pg_conn.rollback()
+        return
+    except psycopg2.Error as pg_err:
+        logging.error(f"❌ PostgreSQL connection error: {pg_err}")
+        print(f"Error connecting to PostgreSQL: {pg_err}")
+        if pg_conn:
+            pg_conn.rollback()
+        return
+    except Exception as e:
+        logging.error(f"❌ Migration failed: {e}")
+        print(f"Migration failed: {e}")
+        if pg_conn:
+            pg_conn.rollback()
+        return
+
+    finally:
+        # Return connections and shut the pools down
+        try:
+            if mysql_cursor:
+                mysql_cursor.close()
+            if mysql_conn:
+                mysql_conn.close()  # Returns the connection to the pool
+            if pg_cursor:
+                pg_cursor.close()
+            if pg_conn and pg_pool:
+                pg_pool.putconn(pg_conn)
+            if pg_pool:
+                pg_pool.closeall()
+        except Exception as e:
+            logging.warning(f"⚠ Error closing connections: {e}")
+
+if __name__ == "__main__":
+    print("MySQL to PostgreSQL Migration Tool")
+    print("=" * 40)
+    print(f"Version: {__version__}")
+    print("=" * 40)
+    print()
+    
+    try:
+        creds = get_credentials()
+        print("\nStarting migration process...")
+        print("=" * 40)
+        migrate_all(creds)
+    except ValueError as ve:
+        print(f"\n❌ Input validation error: {ve}")
+        logging.error(f"Input validation error: {ve}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print("\n\n❌ Migration aborted by user.")
+        logging.warning("Migration aborted by user")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Unexpected error: {e}")
+        logging.error(f"Unexpected error: {e}", exc_info=True)
         sys.exit(1)
\ No newline at end of file